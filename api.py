@@ -10,4 +10,6 @@ app = create_app()
 __all__ = ["app", "reset_game_state"]
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # threaded=True keeps multiple pollers responsive; see run_server.py
+    # for the uvicorn-based host.
+    app.run(host="0.0.0.0", port=5000, debug=True, threaded=True)
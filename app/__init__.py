@@ -5,6 +5,7 @@ from __future__ import annotations
 from flask import Flask
 
 from app.core.config import DevelopmentConfig
+from app.core.json import OrjsonProvider
 from app.routes import blackjack_bp, poker_bp
 
 
@@ -13,16 +14,36 @@ def create_app(config_object: type | None = None) -> Flask:
     app = Flask(__name__)
     config = config_object or DevelopmentConfig
     app.config.from_object(config)
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
 
     app.register_blueprint(poker_bp)
     app.register_blueprint(blackjack_bp)
 
+    # Snapshot payloads compress well; enable gzip/brotli when the
+    # optional flask-compress package is installed.
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        pass
+    else:
+        app.config.setdefault("COMPRESS_ALGORITHM", ["br", "gzip"])
+        app.config.setdefault("COMPRESS_MIN_SIZE", 256)
+        app.config.setdefault("COMPRESS_LEVEL", 4)
+        Compress(app)
+
+    # Resolve the CORS headers once instead of per response.
+    cors_headers = (
+        ("Access-Control-Allow-Origin", app.config.get("CORS_ALLOW_ORIGINS", "*")),
+        ("Access-Control-Allow-Headers", "Content-Type,Authorization"),
+        ("Access-Control-Allow-Methods", "GET,POST,OPTIONS"),
+    )
+
     @app.after_request
     def add_cors_headers(response):  # type: ignore[override]
-        origin = app.config.get("CORS_ALLOW_ORIGINS", "*")
-        response.headers.setdefault("Access-Control-Allow-Origin", origin)
-        response.headers.setdefault("Access-Control-Allow-Headers", "Content-Type,Authorization")
-        response.headers.setdefault("Access-Control-Allow-Methods", "GET,POST,OPTIONS")
+        setdefault = response.headers.setdefault
+        for name, value in cors_headers:
+            setdefault(name, value)
         return response
 
     return app
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from http import HTTPStatus
 
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, request
 from werkzeug.exceptions import BadRequest, Conflict
 
 from app.services.blackjack.state_manager import (
@@ -13,7 +13,6 @@ from app.services.blackjack.state_manager import (
     InvalidBlackjackAction,
     MissingConfigurationError,
     blackjack_state_manager,
-    serialize_state,
 )
 
 blackjack_bp = Blueprint("blackjack", __name__, url_prefix="/api/v1/blackjack")
@@ -22,8 +21,7 @@ blackjack_bp = Blueprint("blackjack", __name__, url_prefix="/api/v1/blackjack")
 @blackjack_bp.route("/table", methods=["GET"])
 def get_blackjack_table() -> Response:
     """Return current blackjack snapshot."""
-    state = blackjack_state_manager.ensure_state()
-    return jsonify(serialize_state(state))
+    return Response(blackjack_state_manager.snapshot_bytes(), mimetype="application/json")
 
 
 @blackjack_bp.route("/config", methods=["POST"])
@@ -35,7 +33,7 @@ def configure_blackjack() -> Response:
     min_bet = payload.get("min_bet")
     max_bet = payload.get("max_bet")
     try:
-        state = blackjack_state_manager.configure(
+        blackjack_state_manager.configure(
             bankroll=bankroll,
             shoe_decks=shoe_decks,
             min_bet=int(min_bet) if min_bet is not None else None,
@@ -43,7 +41,11 @@ def configure_blackjack() -> Response:
         )
     except InvalidBlackjackAction as exc:
         raise BadRequest(str(exc)) from exc
-    return jsonify(serialize_state(state)), HTTPStatus.CREATED
+    return Response(
+        blackjack_state_manager.snapshot_bytes(),
+        status=HTTPStatus.CREATED,
+        mimetype="application/json",
+    )
 
 
 @blackjack_bp.route("/table/action", methods=["POST"])
@@ -54,21 +56,37 @@ def blackjack_action() -> Response:
     if not action:
         raise BadRequest("Action is required.")
     try:
-        state = blackjack_state_manager.apply_action(action=action, payload=payload)
+        blackjack_state_manager.apply_action(action=action, payload=payload)
     except MissingConfigurationError as exc:
         raise Conflict(str(exc)) from exc
     except InvalidBlackjackAction as exc:
         raise BadRequest(str(exc)) from exc
-    return jsonify(serialize_state(state))
+    return Response(blackjack_state_manager.snapshot_bytes(), mimetype="application/json")
+
+
+@blackjack_bp.route("/table/actions:batch", methods=["POST"])
+def blackjack_actions_batch() -> Response:
+    """Apply a list of actions in one request and return one snapshot."""
+    payload = request.get_json(silent=True) or {}
+    actions = payload.get("actions")
+    if not isinstance(actions, list) or not actions:
+        raise BadRequest("A non-empty 'actions' list is required.")
+    try:
+        blackjack_state_manager.apply_actions(actions)
+    except MissingConfigurationError as exc:
+        raise Conflict(str(exc)) from exc
+    except InvalidBlackjackAction as exc:
+        raise BadRequest(str(exc)) from exc
+    return Response(blackjack_state_manager.snapshot_bytes(), mimetype="application/json")
 
 
 @blackjack_bp.route("/table/next-hand", methods=["POST"])
 def blackjack_next_hand() -> Response:
     """Reset per-hand state while keeping bankroll/shoe."""
     try:
-        state = blackjack_state_manager.start_next_hand()
+        blackjack_state_manager.start_next_hand()
     except MissingConfigurationError as exc:
         raise Conflict(str(exc)) from exc
     except InvalidBlackjackAction as exc:
         raise BadRequest(str(exc)) from exc
-    return jsonify(serialize_state(state)), HTTPStatus.OK
+    return Response(blackjack_state_manager.snapshot_bytes(), mimetype="application/json")
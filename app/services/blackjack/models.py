@@ -9,32 +9,34 @@ from typing import Iterable, List, Optional, Tuple
 from common.card import Card
 
 
+# Blackjack value per rank, with lowercase aliases so no per-card
+# case-normalization is needed in the hot totalling path.
+_CARD_VALUES = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "T": 10, "J": 10, "Q": 10, "K": 10, "A": 11,
+    "t": 10, "j": 10, "q": 10, "k": 10, "a": 11,
+}
+
+
 def card_value(card: Card) -> int:
     """Return the blackjack value of a single card."""
-    rank = card.figure.upper()
-    if rank in {"K", "Q", "J", "T"}:
-        return 10
-    if rank == "A":
-        return 11
-    return int(rank)
+    return _CARD_VALUES[card.figure]
 
 
 def compute_hand_total(cards: Iterable[Card]) -> Tuple[int, bool]:
     """Compute total and whether the hand is soft."""
+    value_of = _CARD_VALUES.__getitem__
     total = 0
     aces = 0
     for card in cards:
-        value = card_value(card)
+        value = value_of(card.figure)
         if value == 11:
             aces += 1
         total += value
-    is_soft = False
     while total > 21 and aces:
         total -= 10
         aces -= 1
-    if aces > 0:
-        is_soft = True
-    return total, is_soft
+    return total, aces > 0
 
 
 class HandStatus(str, Enum):
@@ -50,7 +52,7 @@ class HandStatus(str, Enum):
         return self in {HandStatus.STANDING, HandStatus.BUSTED, HandStatus.SURRENDERED, HandStatus.BLACKJACK}
 
 
-@dataclass
+@dataclass(slots=True)
 class BlackjackHand:
     """Represents a single player hand."""
 
@@ -60,16 +62,34 @@ class BlackjackHand:
     doubled: bool = False
     split_from: Optional[int] = None
     has_taken_action: bool = False
+    _total: int = field(default=0, repr=False)
+    _soft_aces: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self._recount()
+
+    def _recount(self) -> None:
+        """Rebuild the cached running total from scratch."""
+        total = 0
+        aces = 0
+        for card in self.cards:
+            value = card_value(card)
+            if value == 11:
+                aces += 1
+            total += value
+        while total > 21 and aces:
+            total -= 10
+            aces -= 1
+        self._total = total
+        self._soft_aces = aces
 
     @property
     def total(self) -> int:
-        value, _ = compute_hand_total(self.cards)
-        return value
+        return self._total
 
     @property
     def is_soft(self) -> bool:
-        _, is_soft = compute_hand_total(self.cards)
-        return is_soft
+        return self._soft_aces > 0
 
     @property
     def is_blackjack(self) -> bool:
@@ -100,9 +120,22 @@ class BlackjackHand:
 
     def add_card(self, card: Card) -> None:
         self.cards.append(card)
+        value = card_value(card)
+        self._total += value
+        if value == 11:
+            self._soft_aces += 1
+        while self._total > 21 and self._soft_aces:
+            self._total -= 10
+            self._soft_aces -= 1
+
+    def pop_card(self) -> Card:
+        """Remove and return the last card, keeping the cached total in sync."""
+        card = self.cards.pop()
+        self._recount()
+        return card
 
 
-@dataclass
+@dataclass(slots=True)
 class BlackjackConfig:
     """Runtime configuration for a blackjack training session."""
 
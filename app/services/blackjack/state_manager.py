@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from threading import RLock
+from threading import Lock
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 from common.card import Card
@@ -16,12 +18,15 @@ from .models import (
     HandStatus,
     card_value,
     compute_hand_total,
-    serialize_card,
 )
 
 DEFAULT_BANKROLL = 1_000
 DEFAULT_DECKS = 5
 
+# Alternating player/dealer deal order for the opening hand. Splits cannot
+# happen before the deal, so there is always exactly one player hand here.
+_INITIAL_DEAL_SEQUENCE = (("player", 0), ("dealer", 0), ("player", 0), ("dealer", 0))
+
 
 class BlackjackPhase(str, Enum):
     """Lifecycle phases for a blackjack hand."""
@@ -47,7 +52,7 @@ class InvalidBlackjackAction(BlackjackError):
     """Raised when an invalid action is requested."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BlackjackState:
     """In-memory blackjack session."""
 
@@ -58,7 +63,7 @@ class BlackjackState:
     player_hands: List[BlackjackHand] = field(default_factory=list)
     phase: BlackjackPhase = BlackjackPhase.NEEDS_CONFIGURATION
     hand_number: int = 0
-    pending_initial_sequence: List[Tuple[str, int]] = field(default_factory=list)
+    pending_initial_sequence: deque[Tuple[str, int]] = field(default_factory=deque)
     active_hand_index: Optional[int] = None
     insurance_bet: int = 0
     messages: List[str] = field(default_factory=list)
@@ -66,9 +71,11 @@ class BlackjackState:
     shoe_needs_shuffle: bool = False
 
     def reset_hand_state(self) -> None:
+        # Reuse the existing containers (clear keeps their capacity) and
+        # only reallocate the dealer hand, which must start fresh.
         self.dealer_hand = BlackjackHand()
-        self.player_hands = []
-        self.pending_initial_sequence = []
+        self.player_hands.clear()
+        self.pending_initial_sequence.clear()
         self.active_hand_index = None
         self.insurance_bet = 0
         self.messages.clear()
@@ -81,14 +88,41 @@ class BlackjackStateManager:
 
     def __init__(self) -> None:
         self._state = BlackjackState()
-        self._lock = RLock()
+        # Plain Lock: no handler re-enters the manager while holding it.
+        self._lock = Lock()
+        self._rev = 0
+        self._snapshot_cache: Optional[tuple[int, bytes]] = None
+        self._payload_cache: Optional[tuple[int, Dict[str, Any]]] = None
+
+    def _bump_revision(self) -> None:
+        """Mark the state as changed so cached snapshots are invalidated."""
+        self._rev += 1
+
+    def snapshot_bytes(self) -> bytes:
+        """Return the serialized snapshot, reusing the cached encoding when unchanged."""
+        from app.core.json import dumps_bytes
+
+        cached = self._snapshot_cache
+        # Capture the revision before serializing so a concurrent mutation
+        # invalidates this entry rather than validating a torn snapshot.
+        rev = self._rev
+        if cached is not None and cached[0] == rev:
+            return cached[1]
+        payload = dumps_bytes(self.serialize_state(self._state))
+        self._snapshot_cache = (rev, payload)
+        return payload
 
     def ensure_state(self) -> BlackjackState:
+        # Lock-free read; handlers mutate the live state under the lock,
+        # so callers may see a mid-action view. The snapshot caches stamp
+        # entries with a pre-serialization revision so such views are
+        # never pinned.
         return self._state
 
     def reset(self) -> BlackjackState:
         with self._lock:
             self._state = BlackjackState()
+            self._bump_revision()
             return self._state
 
     def configure(
@@ -124,6 +158,7 @@ class BlackjackStateManager:
                 phase=BlackjackPhase.WAITING_FOR_BET,
             )
             self._state = state
+            self._bump_revision()
             return state
 
     def start_next_hand(self) -> BlackjackState:
@@ -139,29 +174,56 @@ class BlackjackStateManager:
                 state.shoe.reset()
                 state.shoe_needs_shuffle = False
             state.reset_hand_state()
+            self._bump_revision()
             return state
 
     def apply_action(self, *, action: str, payload: Dict[str, Any]) -> BlackjackState:
+        # Resolve the handler before taking the lock so invalid actions
+        # never pay for it; the table itself is built once at class body time.
+        handler = self._ACTION_HANDLERS.get(action)
+        if handler is None:
+            raise InvalidBlackjackAction(f"Unsupported action '{action}'")
         with self._lock:
             state = self.ensure_state()
             if state.config is None or state.shoe is None:
                 raise MissingConfigurationError("Configure blackjack before playing.")
+            try:
+                handler(self, state, payload)
+            finally:
+                # Bump even on failure: a handler that raises mid-mutation
+                # (e.g. shoe exhaustion during a draw) must still invalidate
+                # the cached snapshots.
+                self._bump_revision()
+            return state
 
-            handlers = {
-                "place_bet": self._handle_place_bet,
-                "deal": self._handle_deal,
-                "hit": self._handle_hit,
-                "stand": self._handle_stand,
-                "double": self._handle_double,
-                "split": self._handle_split,
-                "surrender": self._handle_surrender,
-                "buy_insurance": self._handle_buy_insurance,
-                "skip_insurance": self._handle_skip_insurance,
-            }
-            handler = handlers.get(action)
+    def apply_actions(self, actions: List[Dict[str, Any]]) -> BlackjackState:
+        """Apply a sequence of actions under one lock acquisition.
+
+        Handlers are resolved up front so a malformed batch fails before
+        any state changes; a failure mid-batch raises with earlier actions
+        already applied, mirroring what the same requests would have done
+        one POST at a time.
+        """
+        resolved = []
+        for entry in actions:
+            if not isinstance(entry, dict):
+                raise InvalidBlackjackAction("Each batch entry must be an action object.")
+            action = entry.get("action")
+            if not isinstance(action, str) or not action:
+                raise InvalidBlackjackAction("Each batch entry requires an 'action' string.")
+            handler = self._ACTION_HANDLERS.get(action)
             if handler is None:
                 raise InvalidBlackjackAction(f"Unsupported action '{action}'")
-            handler(state, payload)
+            resolved.append((handler, entry))
+        with self._lock:
+            state = self.ensure_state()
+            if state.config is None or state.shoe is None:
+                raise MissingConfigurationError("Configure blackjack before playing.")
+            try:
+                for handler, entry in resolved:
+                    handler(self, state, entry)
+            finally:
+                self._bump_revision()
             return state
 
     # -- action handlers -------------------------------------------------
@@ -180,21 +242,14 @@ class BlackjackStateManager:
         state.hand_number += 1
         state.player_hands = [BlackjackHand(bet=amount)]
         state.dealer_hand = BlackjackHand()
-        state.pending_initial_sequence = []
-        hand_indices = list(range(len(state.player_hands)))
-        # First orbit: everyone (including dealer) sees exactly one card.
-        for idx in hand_indices:
-            state.pending_initial_sequence.append(("player", idx))
-        state.pending_initial_sequence.append(("dealer", 0))
-        # Second orbit: players finish their opening hands before the dealer closes the deal.
-        for idx in hand_indices:
-            state.pending_initial_sequence.append(("player", idx))
-        state.pending_initial_sequence.append(("dealer", 0))
+        state.pending_initial_sequence.clear()
+        state.pending_initial_sequence.extend(_INITIAL_DEAL_SEQUENCE)
         state.active_hand_index = 0
         state.phase = BlackjackPhase.INITIAL_DEAL
         state.bankroll -= amount
         state.insurance_bet = 0
-        state.messages = [f"Hand #{state.hand_number} — bet {amount} chips."]
+        state.messages.clear()
+        state.messages.append(f"Hand #{state.hand_number} — bet {amount} chips.")
         state.hand_results.clear()
 
     def _handle_deal(self, state: BlackjackState, _: Dict[str, Any]) -> None:
@@ -202,7 +257,7 @@ class BlackjackStateManager:
             raise InvalidBlackjackAction("Initial deal already finished.")
         if not state.pending_initial_sequence:
             raise InvalidBlackjackAction("All initial cards dealt.")
-        target, hand_index = state.pending_initial_sequence.pop(0)
+        target, hand_index = state.pending_initial_sequence.popleft()
         card = self._draw_card(state)
         if target == "player":
             state.player_hands[hand_index].add_card(card)
@@ -211,12 +266,29 @@ class BlackjackStateManager:
         if not state.pending_initial_sequence:
             self._post_initial_deal(state)
 
+    def _handle_deal_all(self, state: BlackjackState, _: Dict[str, Any]) -> None:
+        """Finish the initial deal in one action instead of one POST per card."""
+        if state.phase != BlackjackPhase.INITIAL_DEAL:
+            raise InvalidBlackjackAction("Initial deal already finished.")
+        if not state.pending_initial_sequence:
+            raise InvalidBlackjackAction("All initial cards dealt.")
+        pending = state.pending_initial_sequence
+        cards = state.shoe.draw_many(len(pending))
+        for card in cards:
+            target, hand_index = pending.popleft()
+            if target == "player":
+                state.player_hands[hand_index].add_card(card)
+            else:
+                state.dealer_hand.add_card(card)
+        state.shoe_needs_shuffle = state.shoe.needs_shuffle(state.config.cut_card_ratio)
+        self._post_initial_deal(state)
+
     def _handle_hit(self, state: BlackjackState, _: Dict[str, Any]) -> None:
         hand = self._require_active_hand(state)
         card = self._draw_card(state)
         hand.add_card(card)
         hand.has_taken_action = True
-        total, _ = compute_hand_total(hand.cards)
+        total = hand.total
         if total > 21:
             hand.status = HandStatus.BUSTED
             state.messages.append(f"Hand {self._hand_label(state)} busts with {total}.")
@@ -245,7 +317,7 @@ class BlackjackStateManager:
         hand.has_taken_action = True
         card = self._draw_card(state)
         hand.add_card(card)
-        total, _ = compute_hand_total(hand.cards)
+        total = hand.total
         hand.status = HandStatus.BUSTED if total > 21 else HandStatus.STANDING
         state.messages.append(f"Double down {'busts' if total > 21 else 'stands'} with {total}.")
         self._advance_hand(state)
@@ -259,14 +331,17 @@ class BlackjackStateManager:
         if state.bankroll < hand.bet:
             raise InvalidBlackjackAction("Insufficient bankroll to split.")
         state.bankroll -= hand.bet
-        moved_card = hand.cards.pop()
+        moved_card = hand.pop_card()
         new_hand = BlackjackHand(cards=[moved_card], bet=hand.bet, split_from=state.active_hand_index)
         state.player_hands.insert(state.active_hand_index + 1, new_hand)
         # deal one more card to each split hand
+        # Capture the index up front: marking the first hand blackjack can
+        # advance active_hand_index before the second mark runs.
+        split_idx = state.active_hand_index
         hand.add_card(self._draw_card(state))
-        self._mark_hand_blackjack(state, hand)
+        self._mark_hand_blackjack(state, hand, split_idx)
         new_hand.add_card(self._draw_card(state))
-        self._mark_hand_blackjack(state, new_hand)
+        self._mark_hand_blackjack(state, new_hand, split_idx + 1)
         state.messages.append(f"Hand {self._hand_label(state)} splits into two hands.")
 
     def _handle_surrender(self, state: BlackjackState, _: Dict[str, Any]) -> None:
@@ -300,6 +375,21 @@ class BlackjackStateManager:
             raise InvalidBlackjackAction("No insurance decision pending.")
         self._peek_after_insurance(state, skipped=True)
 
+    _ACTION_HANDLERS = MappingProxyType(
+        {
+            "place_bet": _handle_place_bet,
+            "deal": _handle_deal,
+            "deal_all": _handle_deal_all,
+            "hit": _handle_hit,
+            "stand": _handle_stand,
+            "double": _handle_double,
+            "split": _handle_split,
+            "surrender": _handle_surrender,
+            "buy_insurance": _handle_buy_insurance,
+            "skip_insurance": _handle_skip_insurance,
+        }
+    )
+
     # -- helpers ---------------------------------------------------------
 
     def _draw_card(self, state: BlackjackState) -> Card:
@@ -396,21 +486,33 @@ class BlackjackStateManager:
 
     def _run_dealer(self, state: BlackjackState) -> None:
         state.phase = BlackjackPhase.DEALER_ACTION
+        # Early-out loop instead of a generator: if no hand is standing
+        # (all busted, surrendered, or blackjack) the dealer has nothing to
+        # beat and only reveals the hole card without drawing.
+        contested = False
+        for hand in state.player_hands:
+            if hand.status == HandStatus.STANDING:
+                contested = True
+                break
+        if not contested:
+            self._resolve_hands(state)
+            return
+        dealer_hand = state.dealer_hand
         while True:
-            total, is_soft = compute_hand_total(state.dealer_hand.cards)
+            total, is_soft = dealer_hand.total, dealer_hand.is_soft
             if total > 21:
                 break
             if total < 17:
-                state.dealer_hand.add_card(self._draw_card(state))
+                dealer_hand.add_card(self._draw_card(state))
                 continue
             if total == 17 and state.config.dealer_hits_soft_17 and is_soft:
-                state.dealer_hand.add_card(self._draw_card(state))
+                dealer_hand.add_card(self._draw_card(state))
                 continue
             break
         self._resolve_hands(state)
 
     def _resolve_hands(self, state: BlackjackState) -> None:
-        dealer_total, _ = compute_hand_total(state.dealer_hand.cards)
+        dealer_total = state.dealer_hand.total
         dealer_busted = dealer_total > 21
         state.hand_results.clear()
         for idx, hand in enumerate(state.player_hands):
@@ -426,7 +528,7 @@ class BlackjackStateManager:
                 state.bankroll += hand.bet + bonus
                 state.hand_results.append(f"{label}: blackjack pays 3:2.")
                 continue
-            hand_total, _ = compute_hand_total(hand.cards)
+            hand_total = hand.total
             if dealer_busted:
                 state.bankroll += hand.bet * 2
                 state.hand_results.append(f"{label}: dealer busts, you win.")
@@ -442,13 +544,9 @@ class BlackjackStateManager:
         state.active_hand_index = None
         state.messages.append("Hand resolved.")
 
-    def _mark_hand_blackjack(self, state: BlackjackState, hand: BlackjackHand) -> None:
+    def _mark_hand_blackjack(self, state: BlackjackState, hand: BlackjackHand, idx: int) -> None:
         if not hand.is_blackjack or hand.status != HandStatus.ACTIVE:
             return
-        try:
-            idx = state.player_hands.index(hand)
-        except ValueError:
-            return
         hand.status = HandStatus.BLACKJACK
         hand.has_taken_action = True
         state.messages.append(f"Hand {idx + 1} hits blackjack.")
@@ -468,6 +566,22 @@ class BlackjackStateManager:
 
     def serialize_state(self, state: Optional[BlackjackState] = None) -> Dict[str, Any]:
         state = state or self.ensure_state()
+        # Payload-level memoization beneath the encoded-bytes cache: polls
+        # between mutations reuse the same dict instead of rebuilding it.
+        is_live = state is self._state
+        # Same pre-serialization revision stamp as snapshot_bytes: a
+        # concurrent mutation must invalidate the entry, not validate it.
+        rev = self._rev
+        if is_live:
+            cached = self._payload_cache
+            if cached is not None and cached[0] == rev:
+                return cached[1]
+        payload = self._build_payload(state)
+        if is_live:
+            self._payload_cache = (rev, payload)
+        return payload
+
+    def _build_payload(self, state: BlackjackState) -> Dict[str, Any]:
         if state.config is None or state.shoe is None:
             return {
                 "phase": BlackjackPhase.NEEDS_CONFIGURATION.value,
@@ -476,52 +590,70 @@ class BlackjackStateManager:
                 "available_actions": {"can_configure": True},
             }
 
-        hands_payload = []
-        for idx, hand in enumerate(state.player_hands):
-            total, is_soft = compute_hand_total(hand.cards)
-            hands_payload.append(
-                {
-                    "id": idx,
-                    "cards": [serialize_card(card) for card in hand.cards],
-                    "bet": hand.bet,
-                    "status": hand.status.value,
-                    "total": total,
-                    "is_soft": is_soft,
-                    "is_blackjack": hand.status == HandStatus.BLACKJACK,
-                    "can_split": hand.can_split
-                    and len(state.player_hands) < state.config.max_hands
-                    and state.bankroll >= hand.bet,
-                    "can_double": hand.can_double and state.bankroll >= hand.bet,
-                    "can_surrender": hand.can_surrender,
-                }
-            )
+        # Hot polling path: bind loop invariants to locals so each hand's
+        # payload is straight dict construction with no repeated lookups.
+        bankroll = state.bankroll
+        split_room = len(state.player_hands) < state.config.max_hands
+        blackjack_status = HandStatus.BLACKJACK
+        hands_payload = [
+            {
+                "id": idx,
+                "cards": list(hand.cards),  # encoded by the orjson default hook
+                "bet": hand.bet,
+                "status": hand.status.value,
+                "total": hand.total,
+                "is_soft": hand.is_soft,
+                "is_blackjack": hand.status is blackjack_status,
+                "can_split": hand.can_split and split_room and bankroll >= hand.bet,
+                "can_double": hand.can_double and bankroll >= hand.bet,
+                "can_surrender": hand.can_surrender,
+            }
+            for idx, hand in enumerate(state.player_hands)
+        ]
 
         reveal_all = state.phase in {BlackjackPhase.DEALER_ACTION, BlackjackPhase.COMPLETE}
         visible_cards = state.dealer_hand.cards if reveal_all else state.dealer_hand.cards[:1]
         hidden_count = 0 if reveal_all else max(0, len(state.dealer_hand.cards) - 1)
-        visible_total, _ = compute_hand_total(visible_cards)
+        if reveal_all:
+            visible_total = state.dealer_hand.total
+        else:
+            visible_total, _ = compute_hand_total(visible_cards)
         dealer_payload: Dict[str, Any] = {
-            "cards": [serialize_card(card) for card in visible_cards],
+            "cards": visible_cards,
             "hidden_cards": hidden_count,
             "visible_total": visible_total,
             "hole_card_revealed": reveal_all,
         }
         if reveal_all:
-            total, is_soft = compute_hand_total(state.dealer_hand.cards)
-            dealer_payload["total"] = total
-            dealer_payload["is_soft"] = is_soft
-
+            dealer_payload["total"] = state.dealer_hand.total
+            dealer_payload["is_soft"] = state.dealer_hand.is_soft
+
+        # Resolve the active hand once; every can_* flag below derives from it.
+        active_hand: Optional[BlackjackHand] = None
+        if state.phase == BlackjackPhase.PLAYER_ACTION and state.active_hand_index is not None:
+            try:
+                candidate = state.player_hands[state.active_hand_index]
+            except IndexError:
+                candidate = None
+            if candidate is not None and candidate.status == HandStatus.ACTIVE:
+                active_hand = candidate
+
+        has_active = active_hand is not None
+        insurance_open = state.phase == BlackjackPhase.INSURANCE
         available_actions = {
             "can_place_bet": state.phase in {BlackjackPhase.WAITING_FOR_BET, BlackjackPhase.COMPLETE}
             and state.bankroll >= state.config.min_bet,
             "can_deal": state.phase == BlackjackPhase.INITIAL_DEAL and bool(state.pending_initial_sequence),
-            "can_hit": state.phase == BlackjackPhase.PLAYER_ACTION and self._has_active_hand(state),
-            "can_stand": state.phase == BlackjackPhase.PLAYER_ACTION and self._has_active_hand(state),
-            "can_double": self._current_hand_can(state, "double"),
-            "can_split": self._current_hand_can(state, "split"),
-            "can_surrender": self._current_hand_can(state, "surrender"),
-            "can_buy_insurance": state.phase == BlackjackPhase.INSURANCE,
-            "can_skip_insurance": state.phase == BlackjackPhase.INSURANCE,
+            "can_hit": has_active,
+            "can_stand": has_active,
+            "can_double": has_active and active_hand.can_double and state.bankroll >= active_hand.bet,
+            "can_split": has_active
+            and active_hand.can_split
+            and len(state.player_hands) < state.config.max_hands
+            and state.bankroll >= active_hand.bet,
+            "can_surrender": has_active and active_hand.can_surrender,
+            "can_buy_insurance": insurance_open,
+            "can_skip_insurance": insurance_open,
             "can_start_next_hand": state.phase == BlackjackPhase.COMPLETE,
         }
 
@@ -556,31 +688,6 @@ class BlackjackStateManager:
             "hand_results": state.hand_results,
         }
 
-    def _has_active_hand(self, state: BlackjackState) -> bool:
-        if state.phase != BlackjackPhase.PLAYER_ACTION or state.active_hand_index is None:
-            return False
-        try:
-            hand = state.player_hands[state.active_hand_index]
-        except IndexError:
-            return False
-        return hand.status == HandStatus.ACTIVE
-
-    def _current_hand_can(self, state: BlackjackState, action: str) -> bool:
-        if state.phase != BlackjackPhase.PLAYER_ACTION or state.active_hand_index is None:
-            return False
-        hand = state.player_hands[state.active_hand_index]
-        if action == "double":
-            return hand.can_double and state.bankroll >= hand.bet
-        if action == "split":
-            return (
-                hand.can_split
-                and len(state.player_hands) < state.config.max_hands
-                and state.bankroll >= hand.bet
-            )
-        if action == "surrender":
-            return hand.can_surrender
-        return False
-
 
 blackjack_state_manager = BlackjackStateManager()
 
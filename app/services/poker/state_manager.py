@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from threading import RLock
+from threading import Lock
 from typing import Any, Dict, Optional
 
 from common.table import Table
@@ -20,7 +20,7 @@ class InvalidActionError(RuntimeError):
     """Raised when an invalid or unsupported action is requested."""
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Container for a running poker hand."""
 
@@ -30,6 +30,11 @@ class GameState:
     bb_pos: int
     hand_number: int = 1
     hand_complete: bool = False
+    cached_actions: Optional[Dict[str, Any]] = None
+
+
+_DEMO_NAMES = ("john", "mark", "alice", "sara", "tom", "ryan", "mia", "liam")
+_DEMO_STACK = 4000
 
 
 def build_demo_table() -> tuple[Table, Dealer, int, int]:
@@ -38,45 +43,48 @@ def build_demo_table() -> tuple[Table, Dealer, int, int]:
     dealer = Dealer(deck)
     table = Table("Table1")
 
-    names = ["john", "mark", "alice", "sara", "tom", "ryan", "mia", "liam"]
-    for name in names:
-        table.sit_player(Player(name, 4000))
+    for name in _DEMO_NAMES:
+        table.sit_player(Player(name, _DEMO_STACK))
+
+    sb_pos, bb_pos = start_demo_hand(table, dealer)
+    return table, dealer, sb_pos, bb_pos
+
 
+def start_demo_hand(table: Table, dealer: Dealer) -> tuple[int, int]:
+    """Shuffle, post blinds, and deal hole cards on an already-seated table."""
+    dealer.community_cards.clear()
+    dealer.muck.clear()
     dealer.shuffle_cards()
     sb_pos, bb_pos = table.post_blinds()
 
-    n_players = len(table.seats)
+    # Deal from the small blind clockwise; rotate the seat list once
+    # instead of recomputing (sb_pos + i) % n per card.
+    deal_order = [
+        player
+        for player in table.seats[sb_pos:] + table.seats[:sb_pos]
+        if player.in_hand
+    ]
     for _ in range(2):
-        for i in range(n_players):
-            idx = (sb_pos + i) % n_players
-            player = table.seats[idx]
-            if getattr(player, "in_hand", False):
-                dealer.deal_card_to_player(player)
+        for player in deal_order:
+            dealer.deal_card_to_player(player)
 
     table.minimal_raise = table.big_blind
-    return table, dealer, sb_pos, bb_pos
+    return sb_pos, bb_pos
 
 
 def build_players_payload(table: Table) -> list[Dict[str, Any]]:
-    payload: list[Dict[str, Any]] = []
-    for i, player in enumerate(table.seats):
-        payload.append(
-            {
-                "seat": i,
-                "name": getattr(player, "name", None),
-                "stack": getattr(player, "stack", 0),
-                "hole_cards": [
-                    {
-                        "rank": getattr(card, "figure", None),
-                        "suit": getattr(card, "suit", None),
-                    }
-                    for card in getattr(player, "hole_cards", [])
-                ],
-                "in_hand": getattr(player, "in_hand", False),
-                "player_bet": getattr(player, "player_bet", 0),
-            }
-        )
-    return payload
+    return [
+        {
+            "seat": i,
+            "name": player.name,
+            "stack": player.stack,
+            # encoded by the orjson default hook via the memoized card payload
+            "hole_cards": list(player.hole_cards),
+            "in_hand": player.in_hand,
+            "player_bet": player.player_bet,
+        }
+        for i, player in enumerate(table.seats)
+    ]
 
 
 def get_active_player(table: Table) -> Optional[Player]:
@@ -89,26 +97,20 @@ def get_active_player(table: Table) -> Optional[Player]:
 
 
 def remaining_players_in_hand(table: Table) -> int:
-    return sum(1 for player in table.seats if getattr(player, "in_hand", False))
+    return table.in_hand_mask.bit_count()
 
 
 def has_pending_actions(table: Table) -> bool:
-    return any(
-        getattr(player, "in_hand", False) and getattr(player, "to_act", False)
-        for player in table.seats
-    )
+    return bool(table.in_hand_mask & table.to_act_mask)
 
 
 def should_start_next_hand(table: Table) -> bool:
-    return remaining_players_in_hand(table) <= 1 or not has_pending_actions(table)
+    in_hand = table.in_hand_mask
+    return in_hand.bit_count() <= 1 or not (in_hand & table.to_act_mask)
 
 
 def compute_min_raise_total(table: Table) -> int:
-    current_call = table.call_amount
-    min_increment = max(table.big_blind, getattr(table, "minimal_raise", table.big_blind))
-    if current_call == 0:
-        return table.big_blind * 2
-    return current_call + min_increment
+    return table.min_raise_total
 
 
 def compute_available_actions(table: Table, *, hand_complete: bool = False) -> Dict[str, Any]:
@@ -131,7 +133,7 @@ def compute_available_actions(table: Table, *, hand_complete: bool = False) -> D
             "raise": {"allowed": False, "min_total": 0, "max_total": 0, "increment": 1},
         }
 
-    current_call = max(0, table.call_amount - getattr(player, "player_bet", 0))
+    current_call = max(0, table.call_amount - player.player_bet)
     can_check = current_call == 0
     can_call = current_call > 0 and player.stack > 0
     can_raise = player.stack > current_call
@@ -145,29 +147,33 @@ def compute_available_actions(table: Table, *, hand_complete: bool = False) -> D
         "raise": {
             "allowed": can_raise,
             "min_total": min_total,
-            "max_total": getattr(player, "player_bet", 0) + player.stack,
+            "max_total": player.player_bet + player.stack,
             "increment": 1,
         },
     }
 
 
 def sync_pot(table: Table) -> None:
-    table.pot = sum(getattr(player, "player_bet", 0) for player in table.seats)
+    table.pot = table.bet_total
 
 
 def advance_to_next_player(table: Table) -> None:
-    if not table.seats:
+    n = len(table.seats)
+    if not n:
         table.active_position = None
         return
-    for _ in range(len(table.seats)):
-        if table.active_position is None:
-            table.active_position = 0
-        else:
-            table.active_position = (table.active_position + 1) % len(table.seats)
-        candidate = table.seats[table.active_position]
-        if candidate.in_hand and getattr(candidate, "to_act", False):
-            return
-    table.active_position = None
+    bits = table.in_hand_mask & table.to_act_mask
+    if not bits:
+        table.active_position = None
+        return
+    pos = table.active_position
+    if pos is None:
+        pos = n - 1  # scan starts at seat 0
+    # Rotate the eligibility bits so the seat after `pos` is bit 0, then
+    # find-first-set gives the distance to the next seat still to act.
+    rotated = ((bits >> (pos + 1)) | (bits << (n - pos - 1))) & table.seats_mask
+    offset = (rotated & -rotated).bit_length() - 1
+    table.active_position = (pos + 1 + offset) % n
 
 
 class PokerStateManager:
@@ -175,21 +181,66 @@ class PokerStateManager:
 
     def __init__(self) -> None:
         self._state: Optional[GameState] = None
-        self._lock = RLock()
+        # Table/players/dealer are pooled across hands; reset in place.
+        self._table: Optional[Table] = None
+        self._dealer: Optional[Dealer] = None
+        # Plain Lock: writers never re-enter the manager while holding it.
+        self._lock = Lock()
+        self._rev = 0
+        self._snapshot_cache: Optional[tuple[int, bytes]] = None
+
+    def _bump_revision(self) -> None:
+        """Mark the state as changed so cached snapshots are invalidated."""
+        self._rev += 1
+
+    def snapshot_bytes(self) -> bytes:
+        """Return the serialized snapshot, reusing the cached encoding when unchanged."""
+        from app.core.json import dumps_bytes
+
+        state = self.ensure_state()
+        cached = self._snapshot_cache
+        # Capture the revision before serializing: a writer racing this
+        # read bumps _rev, so stamping the pre-serialization value means a
+        # torn snapshot can never be validated by the post-mutation rev.
+        rev = self._rev
+        if cached is not None and cached[0] == rev:
+            return cached[1]
+        payload = dumps_bytes(serialize_state(state))
+        self._snapshot_cache = (rev, payload)
+        return payload
 
     def ensure_state(self) -> GameState:
+        # Readers snapshot the attribute without the lock; writers mutate
+        # the live state under it, so readers may observe a mid-action
+        # state. snapshot_bytes guards against caching such a view by
+        # stamping entries with the pre-serialization revision.
+        state = self._state
+        if state is not None:
+            return state
         with self._lock:
             if self._state is None:
                 self._state = self._build_initial_state()
+                self._bump_revision()
             return self._state
 
     def reset_state(self, *, hand_number: int = 1) -> GameState:
         with self._lock:
-            self._state = self._build_initial_state(hand_number=hand_number)
-            return self._state
+            return self._reset_state_locked(hand_number=hand_number)
+
+    def _reset_state_locked(self, *, hand_number: int) -> GameState:
+        self._state = self._build_initial_state(hand_number=hand_number)
+        self._bump_revision()
+        return self._state
 
     def _build_initial_state(self, *, hand_number: int = 1) -> GameState:
-        table, dealer, sb_pos, bb_pos = build_demo_table()
+        if self._table is None:
+            table, dealer, sb_pos, bb_pos = build_demo_table()
+            self._table = table
+            self._dealer = dealer
+        else:
+            table, dealer = self._table, self._dealer
+            table.reset_hand(stack=_DEMO_STACK)
+            sb_pos, bb_pos = start_demo_hand(table, dealer)
         sync_pot(table)
         return GameState(table=table, dealer=dealer, sb_pos=sb_pos, bb_pos=bb_pos, hand_number=hand_number)
 
@@ -198,7 +249,7 @@ class PokerStateManager:
             next_hand = 1
             if self._state is not None:
                 next_hand = self._state.hand_number + 1
-            state = self.reset_state(hand_number=next_hand)
+            state = self._reset_state_locked(hand_number=next_hand)
             state.hand_complete = False
             return state
 
@@ -213,40 +264,60 @@ class PokerStateManager:
             if player is None:
                 raise InvalidActionError("No active player available.")
 
-            actions = compute_available_actions(table)
-            call_amount = actions["call_amount"]
-
-            if action == "fold":
-                self._handle_fold(player)
-            elif action == "check":
-                if not actions["can_check"]:
-                    raise InvalidActionError("Check is not available")
-                self._handle_check(player)
-            elif action == "call":
-                if not actions["can_call"]:
-                    raise InvalidActionError("Call is not available")
-                self._handle_call(table, player, call_amount)
-            elif action == "raise":
-                raise_info = actions["raise"]
-                if not raise_info["allowed"]:
-                    raise InvalidActionError("Raise is not available")
-                amount = payload.get("amount")
-                if not isinstance(amount, int):
-                    raise InvalidActionError("Raise amount must be integer")
-                if not (raise_info["min_total"] <= amount <= raise_info["max_total"]):
-                    raise InvalidActionError("Raise amount must be within allowed range")
-                self._handle_raise(table, player, amount)
-            else:
+            handler = self._ACTION_DISPATCH.get(action)
+            if handler is None:
                 raise InvalidActionError(f"Unsupported action '{action}'")
 
+            actions = compute_available_actions(table)
+            handler(self, table, player, actions, payload)
+
             if should_start_next_hand(table):
                 table.active_position = None
                 state.hand_complete = True
             else:
                 advance_to_next_player(table)
 
+            # Recompute eagerly while we already hold the lock: every
+            # subsequent poll serves the cached dict without a seats scan.
+            state.cached_actions = compute_available_actions(
+                table, hand_complete=state.hand_complete
+            )
+            self._bump_revision()
             return state
 
+    # -- per-action validation wrappers (uniform dispatch signature) -----
+
+    def _do_fold(self, table: Table, player: Player, actions: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        self._handle_fold(player)
+
+    def _do_check(self, table: Table, player: Player, actions: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        if not actions["can_check"]:
+            raise InvalidActionError("Check is not available")
+        self._handle_check(player)
+
+    def _do_call(self, table: Table, player: Player, actions: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        if not actions["can_call"]:
+            raise InvalidActionError("Call is not available")
+        self._handle_call(table, player, actions["call_amount"])
+
+    def _do_raise(self, table: Table, player: Player, actions: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        raise_info = actions["raise"]
+        if not raise_info["allowed"]:
+            raise InvalidActionError("Raise is not available")
+        amount = payload.get("amount")
+        if not isinstance(amount, int):
+            raise InvalidActionError("Raise amount must be integer")
+        if not (raise_info["min_total"] <= amount <= raise_info["max_total"]):
+            raise InvalidActionError("Raise amount must be within allowed range")
+        self._handle_raise(table, player, amount)
+
+    _ACTION_DISPATCH = {
+        "fold": _do_fold,
+        "check": _do_check,
+        "call": _do_call,
+        "raise": _do_raise,
+    }
+
     def _handle_fold(self, player: Player) -> None:
         player.in_hand = False
         player.to_act = False
@@ -266,7 +337,7 @@ class PokerStateManager:
         sync_pot(table)
 
     def _handle_raise(self, table: Table, player: Player, raise_to: int) -> None:
-        current_bet = getattr(player, "player_bet", 0)
+        current_bet = player.player_bet
         additional = raise_to - current_bet
         if additional <= 0:
             raise InvalidActionError("Raise must increase total bet")
@@ -277,11 +348,13 @@ class PokerStateManager:
         previous_call = table.call_amount
         table.call_amount = raise_to
         table.minimal_raise = max(raise_to - previous_call, table.big_blind)
+        table.min_raise_increment = table.minimal_raise
+        table.min_raise_total = raise_to + table.minimal_raise
         player.to_act = False
         for other in table.seats:
             if other is player:
                 continue
-            if getattr(other, "in_hand", False):
+            if other.in_hand:
                 other.to_act = True
         sync_pot(table)
 
@@ -298,25 +371,30 @@ def serialize_state(state: Optional[GameState] = None) -> Dict[str, Any]:
     bb = table.seats[state.bb_pos] if n else None
     active_player = get_active_player(table)
 
+    available_actions = state.cached_actions
+    if available_actions is None:
+        available_actions = compute_available_actions(table, hand_complete=state.hand_complete)
+        state.cached_actions = available_actions
+
     return {
         "name": table.name,
         "dealer_position": btn_pos,
-        "sb": {"seat": state.sb_pos, "name": getattr(sb, "name", None)} if sb is not None else None,
-        "bb": {"seat": state.bb_pos, "name": getattr(bb, "name", None)} if bb is not None else None,
+        "sb": {"seat": state.sb_pos, "name": sb.name} if sb is not None else None,
+        "bb": {"seat": state.bb_pos, "name": bb.name} if bb is not None else None,
         "hand_number": state.hand_number,
         "players": build_players_payload(table),
         "pot": table.pot,
         "call_amount": table.call_amount,
         "active_seat": table.active_position,
         "active_player": {
-            "seat": getattr(active_player, "seat_id", None),
-            "name": getattr(active_player, "name", None),
-            "stack": getattr(active_player, "stack", None),
-            "current_bet": getattr(active_player, "player_bet", None),
+            "seat": active_player.seat_id,
+            "name": active_player.name,
+            "stack": active_player.stack,
+            "current_bet": active_player.player_bet,
         }
         if active_player
         else None,
-        "available_actions": compute_available_actions(table, hand_complete=state.hand_complete),
+        "available_actions": available_actions,
         "hand_complete": state.hand_complete,
     }
 
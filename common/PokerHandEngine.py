@@ -34,6 +34,7 @@ class PokerHandEngine():
         # reset dealer/deck
         self.dealer.shuffle_cards()
         self.dealer.community_cards.clear()
+        self.dealer.muck.clear()
         # reset players
         for p in self.table.seats:
             p.hole_cards.clear()
@@ -57,41 +58,34 @@ class PokerHandEngine():
             bb_player = self.table.seats[bb_pos]
             self.logger.info(
                 "Table positions — BTN: %s (seat %d); SB: %s (seat %d); BB: %s (seat %d)",
-                getattr(btn_player, "name", None),
+                btn_player.name if btn_player is not None else None,
                 btn_pos,
-                getattr(sb_player, "name", None),
+                sb_player.name,
                 sb_pos,
-                getattr(bb_player, "name", None),
+                bb_player.name,
                 bb_pos,
             )
 
-        # deal two hole cards starting from small blind (SB) and clockwise
-        start = sb_pos
-        n = len(self.table.seats)
+        # deal two hole cards starting from small blind (SB) and clockwise;
+        # rotate the seat list once instead of recomputing (sb_pos + i) % n
+        # per card
+        seats = self.table.seats
+        deal_order = [p for p in seats[sb_pos:] + seats[:sb_pos] if p.in_hand]
         for _ in range(2):
-            for i in range(n):
-                idx = (start + i) % n
-                player = self.table.seats[idx]
-                # skip players without stack (eliminated)
-                if not getattr(player, "in_hand", False):
-                    continue
+            for player in deal_order:
                 self.dealer.deal_card_to_player(player)
 
         # Log hole cards for each player before betting round (use logger so CLI / CI can capture)
         self.logger.info("Hole cards dealt — preflop snapshot:")
         for p in self.table.seats:
             # represent hole cards as a compact string (e.g. "Ah Ks")
-            cards_repr = " ".join(repr(c) for c in getattr(p, "hole_cards", []))
+            cards_repr = " ".join(c.short for c in p.hole_cards)
             self.logger.info("%s | in_hand=%s | stack=%s | hole_cards=%s", p.name, p.in_hand, p.stack, cards_repr)
 
         # run betting round
-        n_active = sum(1 for p in self.table.seats if getattr(p, "in_hand", False))
-        # normalize to_act: everyone in_hand must act except BB who already posted (but may need to act if raised to)
-        # We'll rely on loop and flags; start looping
         while True:
             # check if any player still needs to act
-            need_act = any(getattr(p, "to_act", False) and getattr(p, "in_hand", False)
-                           for p in self.table.seats)
+            need_act = bool(self.table.in_hand_mask & self.table.to_act_mask)
             if not need_act:
                 break
 
@@ -99,13 +93,13 @@ class PokerHandEngine():
             player = self.table.seats[current]
 
             # advance if seat/player not eligible
-            if not getattr(player, "in_hand", False) or not getattr(player, "to_act", False):
+            if not player.in_hand or not player.to_act:
                 self.table.active_position = (self.table.active_position + 1) % n
                 continue
 
-            cards_repr = " ".join(repr(c) for c in getattr(player, "hole_cards", []))
+            cards_repr = " ".join(c.short for c in player.hole_cards)
             print(
-                f"Player to act: {player} | seat={getattr(player,'seat_id',None)} | "
+                f"Player to act: {player} | seat={player.seat_id} | "
                 f"stack={player.stack} | bet={player.player_bet} | call_amount={self.table.call_amount} | hole_cards={cards_repr}"
             )
             self.handle_player_decision(player)
@@ -114,25 +108,37 @@ class PokerHandEngine():
             self.table.active_position = (self.table.active_position + 1) % n
 
             # break if only one player remains
-            remaining = [p for p in self.table.seats if getattr(p, "in_hand", False)]
-            if len(remaining) <= 1:
+            if self.table.in_hand_mask.bit_count() <= 1:
                 print("Only one player remaining — hand ends.")
                 break
 
     def handle_player_decision(self, player: 'Player'):
         decision, bet_size = player.make_decision()
+        # make_decision only returns keys present in _HANDLERS
+        self._HANDLERS[decision](self, player, bet_size)
+
+    # -- decision dispatch (uniform (player, bet_size) signature) --------
+
+    def _dispatch_exit(self, player: 'Player', bet_size: int | None):
+        print("Exiting hand.")
+        raise SystemExit
+
+    def _dispatch_fold(self, player: 'Player', bet_size: int | None):
+        self.handle_fold(player)
+
+    def _dispatch_call(self, player: 'Player', bet_size: int | None):
+        self.handle_call(player)
+
+    def _dispatch_raise(self, player: 'Player', bet_size: int | None):
+        assert bet_size is not None
+        self.handle_raise(player, bet_size)
 
-        match decision:
-            case "e":
-                print("Exiting hand.")
-                raise SystemExit
-            case "f":
-                self.handle_fold(player)
-            case "c":
-                self.handle_call(player)
-            case "r":
-                assert bet_size is not None
-                self.handle_raise(player, bet_size)
+    _HANDLERS = {
+        "e": _dispatch_exit,
+        "f": _dispatch_fold,
+        "c": _dispatch_call,
+        "r": _dispatch_raise,
+    }
 
     def handle_call(self, player: 'Player'):
         required = max(0, self.table.call_amount - player.player_bet)
@@ -164,7 +170,7 @@ class PokerHandEngine():
 
         # after a raise, all other in-hand players must act again
         for p in self.table.seats:
-            if p is not player and getattr(p, "in_hand", False):
+            if p is not player and p.in_hand:
                 p.to_act = True
         player.to_act = False
         print(f"{player} raised by {raise_amount}. Paid {pay}. New call amount: {self.table.call_amount}")
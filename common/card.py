@@ -1,7 +1,25 @@
 class Card():
+    # interned instances keyed by (figure, suit); see Card.get
+    _INTERN: dict = {}
+
     def __init__(self, figure, suit):
         self.figure = figure
         self.suit = suit
+        # precomputed display string, e.g. "As" — avoids re-formatting per repr
+        self.short = f"{figure}{suit[0]}"
+
+    @classmethod
+    def get(cls, figure, suit):
+        """Return the interned singleton for (figure, suit).
+
+        Construction paths that go through here share one instance per
+        card, so equality usually resolves on the identity fast path.
+        """
+        key = (figure, suit)
+        card = cls._INTERN.get(key)
+        if card is None:
+            card = cls._INTERN[key] = cls(figure, suit)
+        return card
 
     def get_figure(self):
         return self.figure
@@ -9,5 +27,15 @@ class Card():
     def get_suit(self):
         return self.suit
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Card):
+            return self.figure == other.figure and self.suit == other.suit
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.figure, self.suit))
+
     def __repr__(self):
-        return f"{self.figure}{self.suit[0]}"
+        return self.short
@@ -0,0 +1,95 @@
+"""Memoized dealer-outcome distributions for blackjack EV tooling.
+
+Given a dealer upcard and the remaining shoe composition, the dealer's
+play-out is fully determined by the house rules, so the distribution of
+final outcomes (17, 18, 19, 20, 21, bust) is a pure function of
+(total, soft aces, composition). The same compositions recur constantly
+between hands of one shoe; an lru_cache over the recursion collapses the
+repeated enumeration to a single table read.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from .shoe import Shoe
+
+# blackjack value per figure; the ace counts 11 until it must soften
+_FIGURE_VALUE = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "T": 10, "J": 10, "Q": 10, "K": 10, "A": 11,
+}
+
+#: outcome order of the returned probability tuples; 0 stands for bust
+OUTCOMES = (17, 18, 19, 20, 21, 0)
+
+
+def shoe_composition(shoe: "Shoe") -> Tuple[int, ...]:
+    """Collapse the undrawn shoe to a 10-wide count tuple (values 2..11).
+
+    The tuple is hashable and identical compositions — regardless of suit
+    or draw order — share one cache entry.
+    """
+    counts = [0] * 10
+    for card in shoe:  # Deck iteration yields only undrawn cards
+        counts[_FIGURE_VALUE[card.figure] - 2] += 1
+    return tuple(counts)
+
+
+def dealer_distribution(
+    upcard_value: int,
+    counts: Tuple[int, ...],
+    hit_soft_17: bool = False,
+) -> Tuple[float, ...]:
+    """Probability of each final dealer outcome, ordered as OUTCOMES.
+
+    upcard_value is the dealer's visible card as 2..11 (11 = ace); counts
+    is the remaining composition from shoe_composition, which must not
+    include the upcard itself.
+    """
+    if not 2 <= upcard_value <= 11:
+        raise ValueError("upcard_value must be between 2 and 11")
+    return _play_out(upcard_value, 1 if upcard_value == 11 else 0, counts, hit_soft_17)
+
+
+@lru_cache(maxsize=1 << 16)
+def _play_out(
+    total: int,
+    soft_aces: int,
+    counts: Tuple[int, ...],
+    hit_soft_17: bool,
+) -> Tuple[float, ...]:
+    while total > 21 and soft_aces:
+        total -= 10
+        soft_aces -= 1
+    if total > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    if total >= 18 or (total == 17 and not (hit_soft_17 and soft_aces)):
+        outcome = [0.0] * 6
+        outcome[total - 17] = 1.0
+        return tuple(outcome)
+
+    remaining = sum(counts)
+    if remaining == 0:
+        raise ValueError("composition exhausted before the dealer could stand")
+
+    acc = [0.0] * 6
+    for i, n in enumerate(counts):
+        if not n:
+            continue
+        value = i + 2
+        branch = _play_out(
+            total + value,
+            soft_aces + (1 if value == 11 else 0),
+            counts[:i] + (n - 1,) + counts[i + 1 :],
+            hit_soft_17,
+        )
+        weight = n / remaining
+        for j, p in enumerate(branch):
+            acc[j] += weight * p
+    return tuple(acc)
+
+
+__all__ = ["OUTCOMES", "dealer_distribution", "shoe_composition"]
@@ -3,33 +3,63 @@ from random import shuffle
 from .card import Card
 
 class Deck():
-    default_figures = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
-    default_suits = ['spades', 'diamonds', 'hearts', 'clubs']
+    default_figures = ('A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2')
+    default_suits = ('spades', 'diamonds', 'hearts', 'clubs')
 
 
     def __init__(self, figures=None, suits=None):
-        figures = figures or self.default_figures
-        suits = suits or self.default_suits
-
-        self.deck = [Card(figure, suit) for suit in suits for figure in figures]
+        if figures is None and suits is None:
+            # Standard deck: share the 52 flyweight Card instances instead
+            # of constructing fresh objects (Cards are immutable once built).
+            self.deck = list(_BASE_DECK)
+        else:
+            figures = figures or self.default_figures
+            suits = suits or self.default_suits
+            self.deck = [Card.get(figure, suit) for suit in suits for figure in figures]
+        # cursor to the top of the deck; dealing moves it down instead of
+        # shrinking the list with pop()
+        self._top = len(self.deck)
 
     def __repr__(self):
-        return f"{self.deck}"
+        return f"{self.deck[:self._top]}"
     
     def __iter__(self):
-        return iter(self.deck)
+        return iter(self.deck[:self._top])
     
     def __len__(self):
-        return len(self.deck)
+        return self._top
     
     def __getitem__(self, index):
-        return self.deck[index]
+        return self.deck[:self._top][index]
     
     def pop(self, index=-1):
-        return self.deck.pop(index)
+        if index == -1:
+            if not self._top:
+                raise IndexError("pop from empty deck")
+            self._top -= 1
+            return self.deck[self._top]
+        # explicit index: resolve against the live (undealt) portion only,
+        # so dealt cards above the cursor stay out of reach
+        if index < 0:
+            index += self._top
+        if not 0 <= index < self._top:
+            raise IndexError("pop index out of range")
+        card = self.deck.pop(index)
+        self._top -= 1
+        return card
     
     def shuffle_deck(self):
         shuffle(self.deck)
+        self._top = len(self.deck)
+
+
+# Canonical 52-card deck built once at import; every default Deck deals
+# references to these shared instances.
+_BASE_DECK = tuple(
+    Card.get(figure, suit)
+    for suit in Deck.default_suits
+    for figure in Deck.default_figures
+)
 
 if __name__ == "__main__":
     d = Deck()
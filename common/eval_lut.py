@@ -0,0 +1,179 @@
+"""Constant-time 5-card poker hand ranking.
+
+Ranks each card figure as a unique prime so a 5-card hand's rank multiset
+collapses to one integer key (the product of its primes, order-independent).
+Two lookup tables built once at import — one for flushes, one for unsuited
+hands — map that key to a dense strength rank over all 7462 distinct
+5-card hand classes, 1 being a royal flush. Evaluation is four multiplies,
+a suit comparison, and a dict get.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Iterable, Sequence
+
+from .card import Card
+
+# figure -> numeric rank value, deuce low / ace high
+_RANK_VALUE = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8,
+    "9": 9, "T": 10, "J": 11, "Q": 12, "K": 13, "A": 14,
+}
+
+# figure -> unique prime; products are unique per rank multiset
+_RANK_PRIMES = {
+    "2": 2, "3": 3, "4": 5, "5": 7, "6": 11, "7": 13, "8": 17,
+    "9": 19, "T": 23, "J": 29, "Q": 31, "K": 37, "A": 41,
+}
+
+_PRIME_BY_VALUE = {_RANK_VALUE[f]: _RANK_PRIMES[f] for f in _RANK_VALUE}
+
+# hand-class ordering, strongest first
+STRAIGHT_FLUSH = 1
+FOUR_OF_A_KIND = 2
+FULL_HOUSE = 3
+FLUSH = 4
+STRAIGHT = 5
+THREE_OF_A_KIND = 6
+TWO_PAIR = 7
+ONE_PAIR = 8
+HIGH_CARD = 9
+
+_CLASS_NAMES = {
+    STRAIGHT_FLUSH: "straight flush",
+    FOUR_OF_A_KIND: "four of a kind",
+    FULL_HOUSE: "full house",
+    FLUSH: "flush",
+    STRAIGHT: "straight",
+    THREE_OF_A_KIND: "three of a kind",
+    TWO_PAIR: "two pair",
+    ONE_PAIR: "one pair",
+    HIGH_CARD: "high card",
+}
+
+
+def _straight_high(values: Sequence[int]) -> int:
+    """High card of a 5-distinct-rank straight, 0 if not a straight.
+
+    values must be sorted descending; the wheel (A-5-4-3-2) plays as
+    5-high.
+    """
+    if values[0] == 14 and values[1] == 5:
+        return 5 if values[1:] == [5, 4, 3, 2] else 0
+    return values[0] if values[0] - values[4] == 4 else 0
+
+
+def _product(values: Iterable[int]) -> int:
+    key = 1
+    for v in values:
+        key *= _PRIME_BY_VALUE[v]
+    return key
+
+
+def _build_tables() -> tuple[dict[int, int], dict[int, int], list[int]]:
+    # entry: ((class, inverted tiebreak tuple), key, is_flush)
+    entries: list[tuple[tuple[int, tuple[int, ...]], int, bool]] = []
+
+    def add(hand_class: int, tiebreak: Sequence[int], key: int, is_flush: bool) -> None:
+        entries.append(((hand_class, tuple(-v for v in tiebreak)), key, is_flush))
+
+    # 5 distinct ranks: straight (flush) or high card / plain flush
+    for combo in combinations(range(14, 1, -1), 5):
+        values = list(combo)  # already descending
+        key = _product(values)
+        high = _straight_high(values)
+        if high:
+            add(STRAIGHT_FLUSH, (high,), key, True)
+            add(STRAIGHT, (high,), key, False)
+        else:
+            add(FLUSH, values, key, True)
+            add(HIGH_CARD, values, key, False)
+
+    ranks = range(2, 15)
+    for quad in ranks:
+        for kicker in ranks:
+            if kicker == quad:
+                continue
+            key = _PRIME_BY_VALUE[quad] ** 4 * _PRIME_BY_VALUE[kicker]
+            add(FOUR_OF_A_KIND, (quad, kicker), key, False)
+
+    for trips in ranks:
+        for pair in ranks:
+            if pair == trips:
+                continue
+            key = _PRIME_BY_VALUE[trips] ** 3 * _PRIME_BY_VALUE[pair] ** 2
+            add(FULL_HOUSE, (trips, pair), key, False)
+
+    for trips in ranks:
+        for kickers in combinations(range(14, 1, -1), 2):
+            if trips in kickers:
+                continue
+            key = _PRIME_BY_VALUE[trips] ** 3 * _product(kickers)
+            add(THREE_OF_A_KIND, (trips, *kickers), key, False)
+
+    for pairs in combinations(range(14, 1, -1), 2):
+        for kicker in ranks:
+            if kicker in pairs:
+                continue
+            high_pair, low_pair = pairs
+            key = _PRIME_BY_VALUE[high_pair] ** 2 * _PRIME_BY_VALUE[low_pair] ** 2 * _PRIME_BY_VALUE[kicker]
+            add(TWO_PAIR, (high_pair, low_pair, kicker), key, False)
+
+    for pair in ranks:
+        for kickers in combinations(range(14, 1, -1), 3):
+            if pair in kickers:
+                continue
+            key = _PRIME_BY_VALUE[pair] ** 2 * _product(kickers)
+            add(ONE_PAIR, (pair, *kickers), key, False)
+
+    entries.sort(key=lambda e: e[0])
+
+    flush_lut: dict[int, int] = {}
+    unsuited_lut: dict[int, int] = {}
+    # class_ceiling[c] = worst (highest) rank number belonging to class c
+    class_ceiling = [0] * (HIGH_CARD + 1)
+    for rank, ((hand_class, _), key, is_flush) in enumerate(entries, start=1):
+        if is_flush:
+            flush_lut[key] = rank
+        else:
+            unsuited_lut[key] = rank
+        class_ceiling[hand_class] = rank
+    return flush_lut, unsuited_lut, class_ceiling
+
+
+_FLUSH_LUT, _UNSUITED_LUT, _CLASS_CEILING = _build_tables()
+
+
+def evaluate_five(cards: Sequence[Card]) -> int:
+    """Rank a 5-card hand: 1 (royal flush) .. 7462 (7-5-4-3-2 unsuited)."""
+    c0, c1, c2, c3, c4 = cards
+    primes = _RANK_PRIMES
+    key = (
+        primes[c0.figure]
+        * primes[c1.figure]
+        * primes[c2.figure]
+        * primes[c3.figure]
+        * primes[c4.figure]
+    )
+    if c0.suit == c1.suit == c2.suit == c3.suit == c4.suit:
+        return _FLUSH_LUT[key]
+    return _UNSUITED_LUT[key]
+
+
+def evaluate_best(cards: Sequence[Card]) -> int:
+    """Best 5-card rank over any number of cards >= 5 (e.g. 7 at showdown)."""
+    if len(cards) == 5:
+        return evaluate_five(cards)
+    return min(evaluate_five(combo) for combo in combinations(cards, 5))
+
+
+def hand_class(rank: int) -> str:
+    """Human-readable class ("flush", "two pair", ...) for an evaluated rank."""
+    for hand_cls in range(STRAIGHT_FLUSH, HIGH_CARD + 1):
+        if rank <= _CLASS_CEILING[hand_cls]:
+            return _CLASS_NAMES[hand_cls]
+    raise ValueError(f"rank out of range: {rank}")
+
+
+__all__ = ["evaluate_five", "evaluate_best", "hand_class"]
@@ -1,42 +1,117 @@
 from __future__ import annotations
+import sys
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .table import Table
     from .card import Card
 
+# CLI prompt text is constant; build it once instead of re-formatting the
+# string on every retry of the decision loop.
+_DECISION_PROMPT = "Choose decision [(c)all, (f)old, (r)aise, (e)xit]: "
+_INVALID_DECISION_MSG = "That is not a valid decision.\n"
+# valid one-letter decisions; frozenset membership is one hash probe
+_VALID_DECISIONS = frozenset(("c", "f", "r", "e"))
+
+
+def _read_line(prompt: str) -> str:
+    """Blocking prompt+read pair on the standard streams.
+
+    Cheaper than input() in a retry loop (no readline setup per call) and
+    raises EOFError on closed stdin just like input() does.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
 class Player():
+    __slots__ = (
+        "name",
+        "hole_cards",
+        "_in_hand",
+        "_to_act",
+        "active",
+        "stack",
+        "seat_id",
+        "position",
+        "_player_bet",
+        "table",
+    )
+
     def __init__(self, name: str, stack: int, table: Optional['Table']=None):
         self.name = name
         self.hole_cards: list['Card'] = []
-        self.in_hand: bool = True
-        self.to_act: bool = True
+        self._in_hand: bool = True
+        self._to_act: bool = True
         self.active: bool = True
         self.stack = stack
         self.seat_id: int = None
         self.position: str = None
-        self.player_bet: int = 0
+        self._player_bet: int = 0
         self.table = table
 
     def __repr__(self):
         return f"Player {self.name} ({self.stack})"
 
+    @property
+    def in_hand(self) -> bool:
+        return self._in_hand
+
+    @in_hand.setter
+    def in_hand(self, value: bool) -> None:
+        self._in_hand = value
+        table = self.table
+        if table is not None and self.seat_id is not None:
+            bit = 1 << self.seat_id
+            if value:
+                table.in_hand_mask |= bit
+            else:
+                table.in_hand_mask &= ~bit
+
+    @property
+    def to_act(self) -> bool:
+        return self._to_act
+
+    @to_act.setter
+    def to_act(self, value: bool) -> None:
+        self._to_act = value
+        table = self.table
+        if table is not None and self.seat_id is not None:
+            bit = 1 << self.seat_id
+            if value:
+                table.to_act_mask |= bit
+            else:
+                table.to_act_mask &= ~bit
+
+    @property
+    def player_bet(self) -> int:
+        return self._player_bet
+
+    @player_bet.setter
+    def player_bet(self, value: int) -> None:
+        table = self.table
+        if table is not None and self.seat_id is not None:
+            table.bet_total += value - self._player_bet
+        self._player_bet = value
+
     def receive_card(self, card: 'Card'):
         self.hole_cards.append(card)
 
     def make_decision(self) -> tuple[str, int | None]:
-        choices = ("c", "f", "r", "e")
-        choices_message = "Choose decision [(c)all, (f)old, (r)aise, (e)xit]: "
         bet_size = None
 
         while True:
-            decision = input(f"{choices_message}")
-            if decision in choices:
+            decision = _read_line(_DECISION_PROMPT)
+            if decision in _VALID_DECISIONS:
                 break
-            print("That is not a valid decision.")
-        
+            sys.stdout.write(_INVALID_DECISION_MSG)
+
         if decision == "r":
-            bet_size = self.choose_bet_size()        
+            bet_size = self.choose_bet_size()
 
         return decision, bet_size
     
@@ -52,11 +127,14 @@ class Player():
             f"This is interpreted as additional amount on top of current call ({self.table.call_amount}). "
             f"Minimum raise: {self.table.minimal_raise}\n> "
         )
+        minimal_raise = self.table.minimal_raise
         while True:
-            bet_size = input(prompt)
-            if bet_size.isnumeric():
-                bet_size = int(bet_size)
-                if bet_size >= self.table.minimal_raise:
-                    break
-            print(f"Invalid raise: must be integer >= {self.table.minimal_raise}")
-        return bet_size
\ No newline at end of file
+            raw = _read_line(prompt)
+            # isdecimal() matches exactly the characters int() accepts;
+            # isdigit()/isnumeric() also pass superscripts and fractions
+            # that int() then rejects
+            if raw.isdecimal():
+                bet_size = int(raw, 10)
+                if bet_size >= minimal_raise:
+                    return bet_size
+            print(f"Invalid raise: must be integer >= {minimal_raise}")
\ No newline at end of file
@@ -18,30 +18,56 @@ class Shoe(Deck):
         self.num_decks = num_decks
         self._figures = list(figures or self.default_figures)
         self._suits = list(suits or self.default_suits)
+        # kept for API compatibility; drawn cards are implicit (everything
+        # above the deal cursor) so nothing is appended here anymore
         self.discard_pile: list[Card] = []
 
         super().__init__(figures=self._figures, suits=self._suits)
+        # single-deck template the shoe is replicated from on every rebuild
+        self._base_cards: List[Card] = list(self.deck)
         self._rebuild_shoe()
 
     def _rebuild_shoe(self) -> None:
-        base_cards = list(self.deck)
-        cards: List[Card] = []
-        for _ in range(self.num_decks):
-            for card in base_cards:
-                cards.append(Card(card.figure, card.suit))
-        self.deck = cards
+        # Cards are immutable value objects; replicate the base deck by
+        # reference instead of constructing 52 * num_decks fresh objects.
+        self.deck = self._base_cards * self.num_decks
         self._total_cards = len(self.deck)
+        # derived constants for the per-draw checks below
+        self._inv_total = 1.0 / self._total_cards if self._total_cards else 0.0
+        self._thresholds: dict[float, int] = {}
         self.shuffle_deck()
 
+    @property
+    def deck(self) -> list[Card]:
+        return self._cards
+
+    @deck.setter
+    def deck(self, cards: list[Card]) -> None:
+        # replacing the deck wholesale (rebuild, test rigs) makes every
+        # card live again
+        self._cards = cards
+        self._top = len(cards)
+
     def draw(self) -> Card:
-        if not self.deck:
+        if not self._top:
+            raise RuntimeError("Shoe is empty. Reset before drawing additional cards.")
+        self._top -= 1
+        return self._cards[self._top]
+
+    def draw_many(self, n: int) -> list[Card]:
+        """Draw n cards in one cursor move, in the same order as n draw() calls."""
+        if n < 0:
+            raise ValueError("Cannot draw a negative number of cards")
+        if n > self._top:
             raise RuntimeError("Shoe is empty. Reset before drawing additional cards.")
-        card = self.deck.pop()
-        self.discard_pile.append(card)
-        return card
+        new_top = self._top - n
+        cards = self._cards[new_top : self._top]
+        cards.reverse()
+        self._top = new_top
+        return cards
 
     def cards_remaining(self) -> int:
-        return len(self.deck)
+        return self._top
 
     def total_cards(self) -> int:
         return self._total_cards
@@ -49,12 +75,17 @@ class Shoe(Deck):
     def penetration(self) -> float:
         if self._total_cards == 0:
             return 1.0
-        return 1.0 - (self.cards_remaining() / self._total_cards)
+        return 1.0 - self._top * self._inv_total
 
     def needs_shuffle(self, threshold_ratio: float = 0.25) -> bool:
-        if not 0 < threshold_ratio <= 1:
-            raise ValueError("threshold_ratio must be between 0 and 1")
-        return self.cards_remaining() <= int(self._total_cards * threshold_ratio)
+        # checked after every draw: cache the integer card-count threshold
+        # per ratio so the common path is one dict get + int compare
+        threshold = self._thresholds.get(threshold_ratio)
+        if threshold is None:
+            if not 0 < threshold_ratio <= 1:
+                raise ValueError("threshold_ratio must be between 0 and 1")
+            threshold = self._thresholds[threshold_ratio] = int(self._total_cards * threshold_ratio)
+        return self._top <= threshold
 
     def reset(self) -> None:
         """Rebuild the shoe from scratch and shuffle."""
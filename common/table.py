@@ -1,14 +1,26 @@
 from __future__ import annotations
+from array import array
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .player import Player
 
+# display names for the packed position codes stored in Table.positions
+_POS_NAMES = ("BTN", "SB", "BB", "UTG", "UTG+1", "MP", "HJ", "CO")
+
+
+def position_name(code: int) -> str:
+    """Human-readable name for a packed position code."""
+    return _POS_NAMES[code]
+
+
 class Table():
     def __init__(self, name: str):
         self.name = name
         self.seats: list[Player] = []
-        self.positions: list[str] = []
+        self._n_seats: int = 0
+        # packed position codes (one byte per seat); see position_name
+        self.positions = array('B')
         self.pot: int = 0
         self.dealer_position: int = 0
         self.active_position: int = 0
@@ -18,18 +30,63 @@ class Table():
         self.small_blind: int = self.big_blind // 2
         self.minimal_raise: int = self.big_blind
         self.minimal_bet: int = self.big_blind
+        # derived raise constants, kept in sync when blinds/raises change
+        self.min_open: int = self.big_blind * 2
+        self.min_raise_increment: int = self.big_blind
+        # minimum total a raise must reach, updated wherever call_amount
+        # or the raise increment changes
+        self.min_raise_total: int = self.min_open
+        # per-seat flag bitmasks (bit i mirrors seats[i].in_hand / .to_act)
+        self.in_hand_mask: int = 0
+        self.to_act_mask: int = 0
+        # all-seats mask ((1 << len(seats)) - 1), extended as players sit
+        self.seats_mask: int = 0
+        # _next_seat[i] is the seat after i; rebuilt when a player sits so
+        # blind/rotation math is a table index instead of a modulo
+        self._next_seat: tuple[int, ...] = ()
+        # running sum of seated players' player_bet, kept in sync by the
+        # Player.player_bet setter
+        self.bet_total: int = 0
 
     def sit_player(self, player: Player) -> None:
         self.seats.append(player)
         player.sit_at_table(self)
-        player.seat_id = self.seats.index(player)
+        # the player was just appended, so the index is the last seat
+        player.seat_id = len(self.seats) - 1
+        bit = 1 << player.seat_id
+        self.seats_mask |= bit
+        if player.in_hand:
+            self.in_hand_mask |= bit
+        if player.to_act:
+            self.to_act_mask |= bit
+        self.bet_total += player.player_bet
+        n = self._n_seats = len(self.seats)
+        self._next_seat = tuple((i + 1) % n for i in range(n))
+
+    def reset_hand(self, stack: int | None = None) -> None:
+        """Reset per-hand state in place so the table and players can be
+        reused for the next hand instead of rebuilt."""
+        self.pot = 0
+        self.call_amount = 0
+        self.minimal_raise = self.big_blind
+        self.min_raise_increment = self.big_blind
+        self.min_raise_total = self.min_open
+        self.dealer_position = 0
+        self.active_position = self.dealer_position
+        for p in self.seats:
+            p.hole_cards.clear()
+            p.player_bet = 0
+            if stack is not None:
+                p.stack = stack
+            p.in_hand = p.stack > 0
+            p.to_act = True
+            p.active = True
 
     def change_dealer_position(self):
         # guard against empty table
         if not self.seats:
             return
-        self.dealer_position += 1
-        self.dealer_position %= len(self.seats)
+        self.dealer_position = self._next_seat[self.dealer_position]
         self.active_position = self.dealer_position
 
     def post_blinds(self) -> tuple[int, int]:
@@ -37,11 +94,12 @@ class Table():
 
         Returns (sb_pos, bb_pos).
         """
-        if len(self.seats) < 2:
+        if self._n_seats < 2:
             raise RuntimeError("Need at least two players to post blinds")
 
-        sb_pos = (self.dealer_position + 1) % len(self.seats)
-        bb_pos = (self.dealer_position + 2) % len(self.seats)
+        next_seat = self._next_seat
+        sb_pos = next_seat[self.dealer_position]
+        bb_pos = next_seat[sb_pos]
 
         sb = self.seats[sb_pos]
         bb = self.seats[bb_pos]
@@ -57,31 +115,28 @@ class Table():
         bb.player_bet += bb_amount
 
         self.call_amount = bb_amount
+        self.min_raise_total = bb_amount + self.min_raise_increment
         # first to act preflop is left of BB
-        self.active_position = (bb_pos + 1) % len(self.seats)
+        self.active_position = next_seat[bb_pos]
 
         # Ensure blinds can still act: Big Blind (and Small Blind) must be allowed to act
         # (Big Blind needs the option to check or raise if everyone limps).
-        if hasattr(sb, "to_act"):
-            sb.to_act = True
-        if hasattr(bb, "to_act"):
-            bb.to_act = True
+        sb.to_act = True
+        bb.to_act = True
 
         return sb_pos, bb_pos
 
     def settle_bets_into_pot(self) -> int:
         """Move all player_bet into pot and reset player_bet. Returns amount moved."""
-        moved = 0
+        # The running bet_total already aggregates every seat's bet; read
+        # it once instead of summing per player. Zeroing goes through the
+        # player_bet setter, which walks bet_total back down to zero.
+        moved = self.bet_total
         for p in self.seats:
-            # Skip None or players with zero contributed
-            try:
-                contributed = getattr(p, "player_bet", 0)
-            except Exception:
-                contributed = 0
-            moved += contributed
-            if hasattr(p, "player_bet"):
+            if p.player_bet:
                 p.player_bet = 0
         self.pot += moved
         # reset call amount for next round
         self.call_amount = 0
+        self.min_raise_total = self.min_open
         return moved
\ No newline at end of file
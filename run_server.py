@@ -0,0 +1,32 @@
+"""Serve the app through uvicorn for concurrent polling clients.
+
+The Flask dev server in ``api.py`` handles one request at a time, which
+stalls multiple browser pollers. This entrypoint wraps the WSGI app in
+an ASGI adapter and serves it with uvicorn's event loop (uvloop is used
+automatically when installed). Requires the optional ``asgiref`` and
+``uvicorn`` packages:
+
+    pip install asgiref uvicorn
+    python run_server.py
+"""
+
+from __future__ import annotations
+
+from app import create_app
+
+
+def main() -> None:
+    try:
+        import uvicorn
+        from asgiref.wsgi import WsgiToAsgi
+    except ImportError as exc:
+        raise SystemExit(
+            "run_server.py requires the optional 'asgiref' and 'uvicorn' packages "
+            "(pip install asgiref uvicorn)."
+        ) from exc
+
+    uvicorn.run(WsgiToAsgi(create_app()), host="0.0.0.0", port=5000)
+
+
+if __name__ == "__main__":
+    main()
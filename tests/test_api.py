@@ -174,3 +174,19 @@ def test_next_hand_endpoint_blocks_actions_until_called(client: FlaskClient) ->
     next_resp = client.post("/api/v1/poker/table/next-hand")
     assert next_resp.status_code == 200
     assert next_resp.get_json()["hand_number"] == snapshot["hand_number"] + 1
+
+
+def test_next_hand_resets_min_raise_after_raise(client: FlaskClient) -> None:
+    """Pooled tables must not leak raise sizing into the following hand."""
+    snapshot = client.get("/api/v1/poker/table").get_json()
+    baseline_min = snapshot["available_actions"]["raise"]["min_total"]
+
+    response = client.post("/api/v1/poker/table/action", json={"action": "raise", "amount": 1_000})
+    assert response.status_code == 200
+
+    response = client.post("/api/v1/poker/table/next-hand")
+    assert response.status_code == 200
+    fresh = response.get_json()
+    assert fresh["hand_complete"] is False
+    assert fresh["available_actions"]["raise"]["min_total"] == baseline_min
+
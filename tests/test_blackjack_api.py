@@ -22,15 +22,13 @@ def rig_shoe(cards: Iterable[Card]) -> None:
     """Force the shoe to emit cards in the provided order."""
     state = blackjack_state_manager.ensure_state()
     assert state.shoe is not None
-    sequence = list(cards)
-    state.shoe.deck = list(reversed(sequence))
+    state.shoe.deck = list(cards)[::-1]
     state.shoe.discard_pile.clear()
 
 
 def deal_initial_cards(client: FlaskClient) -> None:
-    for _ in range(4):
-        resp = client.post("/api/v1/blackjack/table/action", json={"action": "deal"})
-        assert resp.status_code == 200
+    resp = client.post("/api/v1/blackjack/table/action", json={"action": "deal_all"})
+    assert resp.status_code == 200
 
 
 def test_blackjack_requires_configuration(client: FlaskClient) -> None:
@@ -169,3 +167,84 @@ def test_split_blackjack_counts_as_blackjack(client: FlaskClient) -> None:
     assert statuses == ["blackjack", "blackjack"]
     assert snapshot["player"]["bankroll"] == 1_300
     assert any("blackjack" in result.lower() for result in snapshot["hand_results"])
+
+
+def test_blackjack_single_deal_actions_step_through_opening(client: FlaskClient) -> None:
+    """The per-card deal action still walks the opening one draw at a time."""
+    configure_session(client)
+    rig_shoe(
+        [
+            Card("9", "hearts"),
+            Card("6", "clubs"),
+            Card("8", "diamonds"),
+            Card("5", "spades"),
+        ]
+    )
+    client.post("/api/v1/blackjack/table/action", json={"action": "place_bet", "amount": 100})
+
+    for remaining in (3, 2, 1):
+        response = client.post("/api/v1/blackjack/table/action", json={"action": "deal"})
+        assert response.status_code == 200
+        snapshot = response.get_json()
+        assert snapshot["phase"] == "initial_deal"
+        assert snapshot["pending_initial_deal"] == remaining
+        assert snapshot["available_actions"]["can_deal"] is True
+
+    response = client.post("/api/v1/blackjack/table/action", json={"action": "deal"})
+    assert response.status_code == 200
+    snapshot = response.get_json()
+    assert snapshot["pending_initial_deal"] == 0
+    assert snapshot["available_actions"]["can_deal"] is False
+    assert snapshot["phase"] == "player_action"
+    assert snapshot["player"]["hands"][0]["total"] == 17
+
+
+def test_blackjack_batch_actions_play_hand_in_one_request(client: FlaskClient) -> None:
+    configure_session(client)
+    rig_shoe(
+        [
+            Card("9", "hearts"),
+            Card("6", "clubs"),
+            Card("8", "diamonds"),
+            Card("5", "spades"),
+            Card("K", "hearts"),
+        ]
+    )
+    response = client.post(
+        "/api/v1/blackjack/table/actions:batch",
+        json={
+            "actions": [
+                {"action": "place_bet", "amount": 100},
+                {"action": "deal_all"},
+                {"action": "stand"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    snapshot = response.get_json()
+    assert snapshot["phase"] == "hand_complete"
+    assert snapshot["player"]["hands"][0]["total"] == 17
+
+
+def test_blackjack_batch_rejects_malformed_entries(client: FlaskClient) -> None:
+    configure_session(client)
+    for bad_actions in (["place_bet"], [{"amount": 100}], [{"action": 7}]):
+        response = client.post(
+            "/api/v1/blackjack/table/actions:batch",
+            json={"actions": bad_actions},
+        )
+        assert response.status_code == 400
+    snapshot = client.get("/api/v1/blackjack/table").get_json()
+    assert snapshot["phase"] == "awaiting_bet"
+
+
+def test_blackjack_batch_rejects_unknown_action_before_applying(client: FlaskClient) -> None:
+    configure_session(client)
+    response = client.post(
+        "/api/v1/blackjack/table/actions:batch",
+        json={"actions": [{"action": "place_bet", "amount": 100}, {"action": "bogus"}]},
+    )
+    assert response.status_code == 400
+    snapshot = client.get("/api/v1/blackjack/table").get_json()
+    assert snapshot["phase"] == "awaiting_bet"
+
@@ -0,0 +1,55 @@
+"""Unit tests for the memoized dealer-outcome distributions."""
+
+from __future__ import annotations
+
+import pytest
+
+from common.dealer_cache import OUTCOMES, dealer_distribution, shoe_composition
+from common.shoe import Shoe
+
+
+def _remove(counts: tuple[int, ...], value: int) -> tuple[int, ...]:
+    i = value - 2
+    return counts[:i] + (counts[i] - 1,) + counts[i + 1 :]
+
+
+def test_shoe_composition_tracks_undrawn_cards() -> None:
+    shoe = Shoe(num_decks=1)
+    counts = shoe_composition(shoe)
+    assert sum(counts) == 52
+    assert counts[8] == 16  # sixteen ten-valued cards per deck
+
+    shoe.draw()
+    after = shoe_composition(shoe)
+    assert sum(after) == 51
+    assert after != counts
+
+
+def test_distribution_sums_to_one() -> None:
+    shoe = Shoe(num_decks=1)
+    counts = _remove(shoe_composition(shoe), 6)
+    dist = dealer_distribution(6, counts)
+    assert abs(sum(dist) - 1.0) < 1e-9
+
+
+def test_forced_outcome_with_tens_only_composition() -> None:
+    # Dealer shows a ten and can only draw tens: always finishes on 20.
+    tens_only = (0, 0, 0, 0, 0, 0, 0, 0, 15, 0)
+    dist = dealer_distribution(10, tens_only)
+    assert dist[OUTCOMES.index(20)] == 1.0
+    assert sum(dist) == 1.0
+
+
+def test_hit_soft_17_changes_ace_up_distribution() -> None:
+    shoe = Shoe(num_decks=1)
+    counts = _remove(shoe_composition(shoe), 11)
+    stand = dealer_distribution(11, counts, hit_soft_17=False)
+    hit = dealer_distribution(11, counts, hit_soft_17=True)
+    assert stand != hit
+    # hitting soft 17 moves probability off a 17 finish
+    assert hit[OUTCOMES.index(17)] < stand[OUTCOMES.index(17)]
+
+
+def test_invalid_upcard_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        dealer_distribution(1, (0,) * 10)
@@ -0,0 +1,74 @@
+"""Unit tests for the 5-card hand ranking tables."""
+
+from __future__ import annotations
+
+from common.card import Card
+from common.eval_lut import evaluate_best, evaluate_five, hand_class
+
+
+def _hand(*specs: tuple[str, str]) -> list[Card]:
+    return [Card.get(figure, suit) for figure, suit in specs]
+
+
+def test_royal_flush_is_rank_one() -> None:
+    royal = _hand(("A", "spades"), ("K", "spades"), ("Q", "spades"), ("J", "spades"), ("T", "spades"))
+    assert evaluate_five(royal) == 1
+    assert hand_class(1) == "straight flush"
+
+
+def test_wheel_straight_flush_is_worst_straight_flush() -> None:
+    wheel = _hand(("A", "hearts"), ("5", "hearts"), ("4", "hearts"), ("3", "hearts"), ("2", "hearts"))
+    assert evaluate_five(wheel) == 10
+    assert hand_class(10) == "straight flush"
+
+
+def test_worst_hand_is_rank_7462() -> None:
+    worst = _hand(("7", "spades"), ("5", "hearts"), ("4", "clubs"), ("3", "diamonds"), ("2", "spades"))
+    assert evaluate_five(worst) == 7462
+    assert hand_class(7462) == "high card"
+
+
+def test_hand_classes_rank_in_the_expected_order() -> None:
+    quads = _hand(("9", "spades"), ("9", "hearts"), ("9", "clubs"), ("9", "diamonds"), ("2", "spades"))
+    full_house = _hand(("8", "spades"), ("8", "hearts"), ("8", "clubs"), ("3", "diamonds"), ("3", "spades"))
+    flush = _hand(("K", "clubs"), ("J", "clubs"), ("8", "clubs"), ("5", "clubs"), ("2", "clubs"))
+    straight = _hand(("9", "spades"), ("8", "hearts"), ("7", "clubs"), ("6", "diamonds"), ("5", "spades"))
+    trips = _hand(("7", "spades"), ("7", "hearts"), ("7", "clubs"), ("K", "diamonds"), ("2", "spades"))
+    two_pair = _hand(("Q", "spades"), ("Q", "hearts"), ("4", "clubs"), ("4", "diamonds"), ("A", "spades"))
+    pair = _hand(("A", "spades"), ("A", "hearts"), ("K", "clubs"), ("Q", "diamonds"), ("J", "spades"))
+    high_card = _hand(("A", "spades"), ("K", "hearts"), ("Q", "clubs"), ("J", "diamonds"), ("9", "spades"))
+
+    ladder = [quads, full_house, flush, straight, trips, two_pair, pair, high_card]
+    ranks = [evaluate_five(hand) for hand in ladder]
+    assert ranks == sorted(ranks), "stronger classes must map to lower ranks"
+
+    names = [hand_class(rank) for rank in ranks]
+    assert names == [
+        "four of a kind",
+        "full house",
+        "flush",
+        "straight",
+        "three of a kind",
+        "two pair",
+        "one pair",
+        "high card",
+    ]
+
+
+def test_kickers_break_ties_within_a_class() -> None:
+    ace_kicker = _hand(("9", "spades"), ("9", "hearts"), ("9", "clubs"), ("9", "diamonds"), ("A", "spades"))
+    deuce_kicker = _hand(("9", "spades"), ("9", "hearts"), ("9", "clubs"), ("9", "diamonds"), ("2", "spades"))
+    assert evaluate_five(ace_kicker) < evaluate_five(deuce_kicker)
+
+
+def test_evaluate_best_finds_the_five_card_nuts_in_seven() -> None:
+    seven = _hand(
+        ("A", "spades"),
+        ("K", "spades"),
+        ("Q", "spades"),
+        ("J", "spades"),
+        ("T", "spades"),
+        ("2", "hearts"),
+        ("3", "clubs"),
+    )
+    assert evaluate_best(seven) == 1